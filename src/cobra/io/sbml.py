@@ -31,7 +31,7 @@ import datetime
 import logging
 import re
 from ast import And, BoolOp, Module, Name, Or
-from collections import defaultdict, namedtuple
+from collections import defaultdict, deque, namedtuple
 from copy import deepcopy
 from io import StringIO
 from pathlib import Path
@@ -39,6 +39,7 @@ from sys import platform
 from typing import IO, Match, Optional, Pattern, Tuple, Type, Union
 
 import libsbml
+import numpy as np
 
 import cobra
 
@@ -488,9 +489,11 @@ def _get_doc_from_filename(filename: Union[str, IO, Path]) -> "libsbml.SBMLDocum
     IOError if file not readable or does not contain SBML.
     CobraSBMLError if input type is not valid.
     """
-    if isinstance(filename, Path) and {".bz2", ".gz"}.isdisjoint(filename.suffixes):
-        doc: libsbml.SBMLDocument = libsbml.readSBMLFromString(filename.read_text())
-    elif isinstance(filename, Path) and {".bz2", ".gz"}.intersection(filename.suffixes):
+    if isinstance(filename, Path):
+        # libsbml streams the file from disk, which avoids holding an additional
+        # copy of the complete SBML string in memory while the document is parsed
+        if not filename.exists():
+            raise IOError(f"The file with '{filename}' does not exist.")
         doc: libsbml.SBMLDocument = libsbml.readSBMLFromFile(str(filename))
     elif isinstance(filename, str):
         if "<sbml" in filename:
@@ -608,8 +611,8 @@ def _sbml_to_model(
         if history.isSetCreatedDate():
             created = history.getCreatedDate().getDateAsString()
 
-        c: "libsbml.ModelCreator"
-        for c in history.getListCreators():
+        for k in range(history.getNumCreators()):
+            c: "libsbml.ModelCreator" = history.getCreator(k)
             creators.append(
                 {
                     "familyName": c.getFamilyName() if c.isSetFamilyName() else None,
@@ -649,9 +652,8 @@ def _sbml_to_model(
     # Compartments
     # FIXME: update with new compartments
     compartments = {}
-    for (
-        compartment
-    ) in model.getListOfCompartments():  # noqa: E501 type: libsbml.Compartment
+    for k in range(model.getNumCompartments()):
+        compartment: "libsbml.Compartment" = model.getCompartment(k)
         cid = _check_required(compartment, compartment.getIdAttribute(), "id")
         compartments[cid] = compartment.getName()
     cobra_model.compartments = compartments
@@ -662,8 +664,8 @@ def _sbml_to_model(
     if model.getNumSpecies() == 0:
         LOGGER.warning("No metabolites in model")
 
-    specie: "libsbml.Species"
-    for specie in model.getListOfSpecies():
+    for k in range(model.getNumSpecies()):
+        specie: "libsbml.Species" = model.getSpecies(k)
         sid = _check_required(specie, specie.getIdAttribute(), "id")
         if f_replace and F_SPECIE in f_replace:
             sid = f_replace[F_SPECIE](sid)
@@ -674,7 +676,9 @@ def _sbml_to_model(
         met.annotation = _parse_annotations(specie)
         met.compartment = specie.getCompartment()
 
-        specie_fbc: "libsbml.FbcSpeciesPlugin" = specie.getPlugin("fbc")
+        specie_fbc: "libsbml.FbcSpeciesPlugin" = (
+            specie.getPlugin("fbc") if model_fbc else None
+        )
         if specie_fbc:
             met.charge = specie_fbc.getCharge()
             met.formula = specie_fbc.getChemicalFormula() or None
@@ -710,7 +714,8 @@ def _sbml_to_model(
 
         metabolites.append(met)
 
-    cobra_model.add_metabolites(metabolites)
+    # lookup of metabolites by id for the stoichiometry of the reactions
+    met_index = {met.id: met for met in metabolites}
 
     # Add exchange reactions for boundary metabolites
     ex_reactions = []
@@ -728,13 +733,13 @@ def _sbml_to_model(
         # species is reactant
         ex_reaction.add_metabolites({met: -1})
         ex_reactions.append(ex_reaction)
-    cobra_model.add_reactions(ex_reactions)
 
     # Genes
+    genes = []
+    gene_ids = set()
     if model_fbc:
-        for (
-            gp
-        ) in model_fbc.getListOfGeneProducts():  # noqa: E501 type: libsbml.GeneProduct
+        for k in range(model_fbc.getNumGeneProducts()):
+            gp: "libsbml.GeneProduct" = model_fbc.getGeneProduct(k)
             gid = _check_required(gp, gp.getIdAttribute(), "id")
             if f_replace and F_GENE in f_replace:
                 gid = f_replace[F_GENE](gid)
@@ -745,45 +750,19 @@ def _sbml_to_model(
             cobra_gene.annotation = _parse_annotations(gp)
             cobra_gene.notes = _parse_notes_dict(gp)
 
-            cobra_model.genes.append(cobra_gene)
-    else:
-        for (
-            cobra_reaction
-        ) in model.getListOfReactions():  # noqa: E501 type: libsbml.Reaction
-            # fallback to notes information
-            notes = _parse_notes_dict(cobra_reaction)
-            if "GENE ASSOCIATION" in notes:
-                gpr = notes["GENE ASSOCIATION"]
-            elif "GENE_ASSOCIATION" in notes:
-                gpr = notes["GENE_ASSOCIATION"]
-            else:
-                gpr = ""
+            genes.append(cobra_gene)
 
-            if len(gpr) > 0:
-                gpr = gpr.replace("(", ";")
-                gpr = gpr.replace(")", ";")
-                gpr = gpr.replace("or", ";")
-                gpr = gpr.replace("and", ";")
-                # Interaction of the above replacements can lead to multiple
-                # ;, which results in empty gids
-                gids = [t.strip() for t in gpr.split(";")]
-                gids = set(gids).difference({""})
-
-                # create missing genes
-                for gid in gids:
-                    if f_replace and F_GENE in f_replace:
-                        gid = f_replace[F_GENE](gid)
+    # GPR rules
+    f_gene = f_replace.get(F_GENE) if f_replace else None
 
-                    if gid not in cobra_model.genes:
-                        cobra_gene = Gene(gid)
-                        cobra_gene.name = gid
-                        cobra_model.genes.append(cobra_gene)
+    bool_ops = {libsbml.SBML_FBC_OR: Or, libsbml.SBML_FBC_AND: And}
 
-    # GPR rules
     def process_association(ass: "libsbml.FbcAssociation") -> Union[BoolOp, Name]:
-        """Recursively convert gpr association to a GPR class.
+        """Convert gpr association to a GPR class.
 
         Defined as inline functions to not pass the replacement dict around.
+        The association tree is walked in post-order with an explicit stack of
+        (node, visited) pairs instead of recursive calls.
 
         Parameters
         ----------
@@ -794,29 +773,47 @@ def _sbml_to_model(
         BoolOp or Name
             AST formatted of the FbcAssociation, which will be processed by GPR().
         """
-        if ass.isFbcOr():
-            return BoolOp(
-                Or(), [process_association(c) for c in ass.getListOfAssociations()]
-            )
-        elif ass.isFbcAnd():
-            return BoolOp(
-                And(), [process_association(c) for c in ass.getListOfAssociations()]
-            )
-        elif ass.isGeneProductRef():
-            g_id = ass.getGeneProduct()
-            if f_replace and F_GENE in f_replace:
-                return Name(id=f_replace[F_GENE](g_id))
+        operands = []
+        stack = deque([(ass, False)])
+        while stack:
+            node, visited = stack.pop()
+            typecode = node.getTypeCode()
+            if typecode in bool_ops:
+                num_children = node.getNumAssociations()
+                if visited:
+                    split = len(operands) - num_children
+                    values = operands[split:]
+                    del operands[split:]
+                    operands.append(BoolOp(bool_ops[typecode](), values))
+                else:
+                    stack.append((node, True))
+                    # children pushed right to left are visited left to right
+                    for i in reversed(range(num_children)):
+                        stack.append((node.getAssociation(i), False))
+            elif typecode == libsbml.SBML_FBC_GENEPRODUCTREF:
+                g_id = node.getGeneProduct()
+                operands.append(Name(id=f_gene(g_id) if f_gene else g_id))
             else:
-                return Name(id=g_id)
+                operands.append(None)
+        return operands[0]
 
     # Reactions
     missing_bounds = False
     reactions = []
+    # parameters by id, looked up once instead of searching the list of
+    # parameters for every flux bound
+    parameters = {}
+    for k in range(model.getNumParameters()):
+        parameter: "libsbml.Parameter" = model.getParameter(k)
+        parameters[parameter.getIdAttribute()] = parameter
+    # equal stoichiometric coefficients share a single number object, which
+    # saves memory since most coefficients are small integers like 1 or -1
+    shared_coefficients = {}
     if model.getNumReactions() == 0:
         LOGGER.warning("No reactions in model")
 
-    reaction: "libsbml.Reaction"
-    for reaction in model.getListOfReactions():
+    for k in range(model.getNumReactions()):
+        reaction: "libsbml.Reaction" = model.getReaction(k)
         rid = _check_required(reaction, reaction.getIdAttribute(), "id")
         if f_replace and F_REACTION in f_replace:
             rid = f_replace[F_REACTION](rid)
@@ -827,12 +824,14 @@ def _sbml_to_model(
 
         # set bounds
         p_ub, p_lb = None, None
-        r_fbc: "libsbml.FbcReactionPlugin" = reaction.getPlugin("fbc")
+        r_fbc: "libsbml.FbcReactionPlugin" = (
+            reaction.getPlugin("fbc") if model_fbc else None
+        )
         if r_fbc:
             # bounds in fbc
             lb_id = r_fbc.getLowerFluxBound()
             if lb_id:
-                p_lb: "libsbml.Parameter" = model.getParameter(lb_id)
+                p_lb: "libsbml.Parameter" = parameters.get(lb_id)
                 if p_lb and p_lb.getConstant() and (p_lb.getValue() is not None):
                     cobra_reaction.lower_bound = p_lb.getValue()
                 else:
@@ -842,7 +841,7 @@ def _sbml_to_model(
 
             ub_id = r_fbc.getUpperFluxBound()
             if ub_id:
-                p_ub: "libsbml.Parameter" = model.getParameter(ub_id)
+                p_ub: "libsbml.Parameter" = parameters.get(ub_id)
                 if p_ub and p_ub.getConstant() and (p_ub.getValue() is not None):
                     cobra_reaction.upper_bound = p_ub.getValue()
                 else:
@@ -893,34 +892,46 @@ def _sbml_to_model(
         reactions.append(cobra_reaction)
 
         # parse equation
-        stoichiometry = defaultdict(lambda: 0)
-        for (
-            sref
-        ) in reaction.getListOfReactants():  # noqa: E501 type: libsbml.SpeciesReference
-            sid = _check_required(sref, sref.getSpecies(), "species")
+        # the required attributes of species references are checked inline,
+        # _check_required is only called to raise the error
+        stoichiometry = {}
+        for i in range(reaction.getNumReactants()):
+            sref: "libsbml.SpeciesReference" = reaction.getReactant(i)
+            sid = sref.getSpecies()
+            if not sid:
+                _check_required(sref, sid, "species")
+            value = sref.getStoichiometry()
+            if value is None:
+                _check_required(sref, value, "stoichiometry")
 
             if f_replace and F_SPECIE in f_replace:
                 sid = f_replace[F_SPECIE](sid)
-            stoichiometry[sid] -= number(
-                _check_required(sref, sref.getStoichiometry(), "stoichiometry")
-            )
+            stoichiometry[sid] = stoichiometry.get(sid, 0) - number(value)
 
-        for (
-            sref
-        ) in reaction.getListOfProducts():  # noqa: E501 type: libsbml.SpeciesReference
-            sid = _check_required(sref, sref.getSpecies(), "species")
+        for i in range(reaction.getNumProducts()):
+            sref: "libsbml.SpeciesReference" = reaction.getProduct(i)
+            sid = sref.getSpecies()
+            if not sid:
+                _check_required(sref, sid, "species")
+            value = sref.getStoichiometry()
+            if value is None:
+                _check_required(sref, value, "stoichiometry")
 
             if f_replace and F_SPECIE in f_replace:
                 sid = f_replace[F_SPECIE](sid)
-            stoichiometry[sid] += number(
-                _check_required(sref, sref.getStoichiometry(), "stoichiometry")
-            )
+            stoichiometry[sid] = stoichiometry.get(sid, 0) + number(value)
 
         # convert to metabolite objects
         object_stoichiometry = {}
-        for met_id in stoichiometry:
-            metabolite = cobra_model.metabolites.get_by_id(met_id)
-            object_stoichiometry[metabolite] = stoichiometry[met_id]
+        for met_id, coefficient in stoichiometry.items():
+            metabolite = met_index.get(met_id)
+            if metabolite is None:
+                raise CobraSBMLError(
+                    f"Species '{met_id}' not found for reaction: {reaction}"
+                )
+            object_stoichiometry[metabolite] = shared_coefficients.setdefault(
+                coefficient, coefficient
+            )
         cobra_reaction.add_metabolites(object_stoichiometry)
 
         # GPR
@@ -951,11 +962,41 @@ def _sbml_to_model(
                     f"in the notes element is discouraged, use "
                     f"fbc:gpr instead: {reaction}"
                 )
+                # without fbc the genes are created from the notes of the
+                # reactions while the reactions are parsed
+                if not model_fbc:
+                    gpr_genes = gpr.replace("(", ";")
+                    gpr_genes = gpr_genes.replace(")", ";")
+                    gpr_genes = gpr_genes.replace("or", ";")
+                    gpr_genes = gpr_genes.replace("and", ";")
+                    # Interaction of the above replacements can lead to multiple
+                    # ;, which results in empty gids
+                    gids = [t.strip() for t in gpr_genes.split(";")]
+                    gids = set(gids).difference({""})
+
+                    # create missing genes
+                    for gid in gids:
+                        if f_replace and F_GENE in f_replace:
+                            gid = f_replace[F_GENE](gid)
+
+                        if gid not in gene_ids:
+                            gene_ids.add(gid)
+                            cobra_gene = Gene(gid)
+                            cobra_gene.name = gid
+                            genes.append(cobra_gene)
+
                 if f_replace and F_GENE in f_replace:
                     gpr = " ".join(f_replace[F_GENE](t) for t in gpr.split(" "))
             cobra_reaction.gpr = GPR.from_string(gpr)
 
+    # Metabolites are added to the model together with the reactions. Adding
+    # metabolites of a model to a reaction outside of the model would copy them.
+    cobra_model.add_metabolites(metabolites)
+    cobra_model.add_reactions(ex_reactions)
+    cobra_model.genes.extend(genes)
     cobra_model.add_reactions(reactions)
+    # lookup of reactions by id for objective and groups
+    reaction_index = {r.id: r for r in cobra_model.reactions}
 
     # Objective
     obj_direction = "max"
@@ -975,17 +1016,13 @@ def _sbml_to_model(
             obj: "libsbml.Objective" = model_fbc.getObjective(obj_id)
             obj_direction = LONG_SHORT_DIRECTION[obj.getType()]
 
-            for (
-                flux_obj
-            ) in (
-                obj.getListOfFluxObjectives()
-            ):  # noqa: E501 type: libsbml.FluxObjective
+            for k in range(obj.getNumFluxObjectives()):
+                flux_obj: "libsbml.FluxObjective" = obj.getFluxObjective(k)
                 rid = flux_obj.getReaction()
                 if f_replace and F_REACTION in f_replace:
                     rid = f_replace[F_REACTION](rid)
-                try:
-                    objective_reaction = cobra_model.reactions.get_by_id(rid)
-                except KeyError:
+                objective_reaction = reaction_index.get(rid)
+                if objective_reaction is None:
                     raise CobraSBMLError(f"Objective reaction '{rid}' not found")
                 try:
                     coefficients[objective_reaction] = number(flux_obj.getCoefficient())
@@ -993,8 +1030,8 @@ def _sbml_to_model(
                     LOGGER.warning(str(e))
     else:
         # some legacy models encode objective coefficients in kinetic laws
-        reaction: "libsbml.Reaction"
-        for reaction in model.getListOfReactions():
+        for k in range(model.getNumReactions()):
+            reaction: "libsbml.Reaction" = model.getReaction(k)
             if reaction.isSetKineticLaw():
                 klaw: "libsbml.KineticLaw" = reaction.getKineticLaw()
                 p_oc: "libsbml.LocalParameter" = klaw.getParameter(
@@ -1004,9 +1041,8 @@ def _sbml_to_model(
                     rid = _check_required(reaction, reaction.getIdAttribute(), "id")
                     if f_replace and F_REACTION in f_replace:
                         rid = f_replace[F_REACTION](rid)
-                    try:
-                        objective_reaction = cobra_model.reactions.get_by_id(rid)
-                    except KeyError:
+                    objective_reaction = reaction_index.get(rid)
+                    if objective_reaction is None:
                         raise CobraSBMLError(f"Objective reaction '{rid}' not found")
                     try:
                         coefficients[objective_reaction] = number(p_oc.getValue())
@@ -1039,16 +1075,16 @@ def _sbml_to_model(
             model_groups.getListOfGroups(),
         ]:
 
-            sbase: "libsbml.SBase"
-            for sbase in obj_list:
+            for k in range(obj_list.size()):
+                sbase: "libsbml.SBase" = obj_list.get(k)
                 if sbase.isSetId():
                     sid_map[sbase.getIdAttribute()] = sbase
                 if sbase.isSetMetaId():
                     metaid_map[sbase.getMetaId()] = sbase
 
         # create groups
-        group: "libsbml.Group"
-        for group in model_groups.getListOfGroups():
+        for k in range(model_groups.getNumGroups()):
+            group: "libsbml.Group" = model_groups.getGroup(k)
             gid = _check_required(group, group.getIdAttribute(), "id")
             if f_replace and F_GROUP in f_replace:
                 gid = f_replace[F_GROUP](gid)
@@ -1060,8 +1096,8 @@ def _sbml_to_model(
             cobra_group.notes = _parse_notes_dict(group)
 
             cobra_members = []
-            member: "libsbml.Member"
-            for member in group.getListOfMembers():
+            for i in range(group.getNumMembers()):
+                member: "libsbml.Member" = group.getMember(i)
                 if member.isSetIdRef():
                     obj = sid_map[member.getIdRef()]
                 elif member.isSetMetaIdRef():
@@ -1076,11 +1112,11 @@ def _sbml_to_model(
                 if typecode == libsbml.SBML_SPECIES:
                     if f_replace and F_SPECIE in f_replace:
                         obj_id = f_replace[F_SPECIE](obj_id)
-                    cobra_member = cobra_model.metabolites.get_by_id(obj_id)
+                    cobra_member = met_index[obj_id]
                 elif typecode == libsbml.SBML_REACTION:
                     if f_replace and F_REACTION in f_replace:
                         obj_id = f_replace[F_REACTION](obj_id)
-                    cobra_member = cobra_model.reactions.get_by_id(obj_id)
+                    cobra_member = reaction_index[obj_id]
                     cobra_member.subsystem = group.name
                 elif typecode == libsbml.SBML_FBC_GENEPRODUCT:
                     if f_replace and F_GENE in f_replace:
@@ -1179,6 +1215,9 @@ def write_sbml_model(
     elif hasattr(filename, "write"):
         # write to file handle
         sbml_str = libsbml.writeSBMLToString(doc)
+        # release the document before writing so that the document and the
+        # serialized string are not both kept in memory during the write
+        del doc
         filename.write(sbml_str)
 
 
@@ -1277,10 +1316,23 @@ def _model_to_sbml(
             unit.setScale(u.scale)
             unit.setMultiplier(u.multiplier)
 
+    # identifiers and bounds are collected once as flat sequences which are
+    # reused for species, reactions, species references and groups
+    metabolite_ids = cobra_model.metabolites.list_attr("id")
+    specie_ids = metabolite_ids
+    if f_replace and F_SPECIE_REV in f_replace:
+        specie_ids = [f_replace[F_SPECIE_REV](mid) for mid in metabolite_ids]
+    reaction_ids = cobra_model.reactions.list_attr("id")
+    if f_replace and F_REACTION_REV in f_replace:
+        reaction_ids = [f_replace[F_REACTION_REV](rid) for rid in reaction_ids]
+    lower_bounds = np.array(cobra_model.reactions.list_attr("lower_bound"), dtype=float)
+    upper_bounds = np.array(cobra_model.reactions.list_attr("upper_bound"), dtype=float)
+    reversible = (lower_bounds < 0).tolist()
+
     # minimum and maximum value from model
     if len(cobra_model.reactions) > 0:
-        min_value = min(cobra_model.reactions.list_attr("lower_bound"))
-        max_value = max(cobra_model.reactions.list_attr("upper_bound"))
+        min_value = float(lower_bounds.min())
+        max_value = float(upper_bounds.max())
     else:
         min_value = config.lower_bound
         max_value = config.upper_bound
@@ -1313,11 +1365,8 @@ def _model_to_sbml(
         # _sbase_annotations(c, com.annotation)
 
     # Species
-    for metabolite in cobra_model.metabolites:
+    for metabolite, mid in zip(cobra_model.metabolites, specie_ids):
         specie: "libsbml.Species" = model.createSpecies()
-        mid = metabolite.id
-        if f_replace and F_SPECIE_REV in f_replace:
-            mid = f_replace[F_SPECIE_REV](mid)
         specie.setId(mid)
         specie.setConstant(False)
         specie.setBoundaryCondition(False)
@@ -1334,11 +1383,13 @@ def _model_to_sbml(
         _sbase_notes_dict(specie, metabolite.notes)
 
     # Genes
+    gene_id_map = {}
     for cobra_gene in cobra_model.genes:
         gp: "libsbml.GeneProduct" = model_fbc.createGeneProduct()
         gid = cobra_gene.id
         if f_replace and F_GENE_REV in f_replace:
             gid = f_replace[F_GENE_REV](gid)
+        gene_id_map[cobra_gene.id] = gid
         gp.setId(gid)
         gname = cobra_gene.name
         if gname is None or len(gname) == 0:
@@ -1356,42 +1407,13 @@ def _model_to_sbml(
     model_fbc.setActiveObjectiveId("obj")
 
     # Reactions
-    reaction_coefficients = linear_reaction_coefficients(cobra_model)
-    for cobra_reaction in cobra_model.reactions:
-        rid = cobra_reaction.id
-        if f_replace and F_REACTION_REV in f_replace:
-            rid = f_replace[F_REACTION_REV](rid)
-        reaction: "libsbml.Reaction" = model.createReaction()
-        reaction.setId(rid)
-        reaction.setName(cobra_reaction.name)
-        reaction.setFast(False)
-        reaction.setReversible((cobra_reaction.lower_bound < 0))
-        _sbase_annotations(reaction, cobra_reaction.annotation)
-        _sbase_notes_dict(reaction, cobra_reaction.notes)
-
-        # stoichiometry
-        for metabolite, stoichiometry in cobra_reaction.metabolites.items():
-            sid = metabolite.id
-            if f_replace and F_SPECIE_REV in f_replace:
-                sid = f_replace[F_SPECIE_REV](sid)
-            if stoichiometry < 0:
-                sref = (
-                    reaction.createReactant()
-                )  # noqa: E501 type: libsbml.SpeciesReference
-                sref.setSpecies(sid)
-                sref.setStoichiometry(-stoichiometry)
-                sref.setConstant(True)
-            else:
-                sref = (
-                    reaction.createProduct()
-                )  # noqa: E501 type: libsbml.SpeciesReference
-                sref.setSpecies(sid)
-                sref.setStoichiometry(stoichiometry)
-                sref.setConstant(True)
-
-        # bounds
-        r_fbc: "libsbml.FbcReactionPlugin" = reaction.getPlugin("fbc")
-        r_fbc.setLowerFluxBound(
+    # The reactions are written in three passes, each creating a single type of
+    # SBML element: the bound parameters, the reactions and the species
+    # references. The order of the written elements is the same as for a
+    # single pass.
+    default_bound_ids = _default_bound_ids()
+    bound_ids = [
+        (
             _create_bound(
                 model,
                 cobra_reaction,
@@ -1399,9 +1421,8 @@ def _model_to_sbml(
                 f_replace=f_replace,
                 units=units,
                 flux_udef=flux_udef,
-            )
-        )
-        r_fbc.setUpperFluxBound(
+                default_bound_ids=default_bound_ids,
+            ),
             _create_bound(
                 model,
                 cobra_reaction,
@@ -1409,16 +1430,38 @@ def _model_to_sbml(
                 f_replace=f_replace,
                 units=units,
                 flux_udef=flux_udef,
-            )
+                default_bound_ids=default_bound_ids,
+            ),
         )
+        for cobra_reaction in cobra_model.reactions
+    ]
+
+    reactions = []
+    reaction_coefficients = linear_reaction_coefficients(cobra_model)
+    for cobra_reaction, rid, is_reversible, (lb_id, ub_id) in zip(
+        cobra_model.reactions, reaction_ids, reversible, bound_ids
+    ):
+        reaction: "libsbml.Reaction" = model.createReaction()
+        reactions.append(reaction)
+        reaction.setId(rid)
+        reaction.setName(cobra_reaction.name)
+        reaction.setFast(False)
+        reaction.setReversible(is_reversible)
+        _sbase_annotations(reaction, cobra_reaction.annotation)
+        _sbase_notes_dict(reaction, cobra_reaction.notes)
+
+        # bounds
+        r_fbc: "libsbml.FbcReactionPlugin" = reaction.getPlugin("fbc")
+        r_fbc.setLowerFluxBound(lb_id)
+        r_fbc.setUpperFluxBound(ub_id)
 
         # GPR
         gpr = cobra_reaction.gpr
         if gpr is not None and gpr.body:
-            # replace ids in string
+            # replace ids in string, the genes of the GPR are genes of the model
+            # so their replaced ids are known from writing the gene products
             if f_replace and F_GENE_REV in f_replace:
-                idmap = {gid: f_replace[F_GENE_REV](gid) for gid in gpr.genes}
-                gpr_new = gpr.to_string(names=idmap)
+                gpr_new = gpr.to_string(names=gene_id_map)
             else:
                 gpr_new = gpr.to_string()
 
@@ -1437,6 +1480,21 @@ def _model_to_sbml(
             flux_obj.setReaction(rid)
             flux_obj.setCoefficient(cobra_reaction.objective_coefficient)
 
+    # stoichiometry
+    # the replaced species ids are looked up instead of being recomputed for
+    # every species reference
+    specie_id_map = dict(zip(metabolite_ids, specie_ids))
+    for cobra_reaction, reaction in zip(cobra_model.reactions, reactions):
+        for metabolite, stoichiometry in cobra_reaction.metabolites.items():
+            if stoichiometry < 0:
+                sref: "libsbml.SpeciesReference" = reaction.createReactant()
+                stoichiometry = -stoichiometry
+            else:
+                sref: "libsbml.SpeciesReference" = reaction.createProduct()
+            sref.setSpecies(specie_id_map[metabolite.id])
+            sref.setStoichiometry(stoichiometry)
+            sref.setConstant(True)
+
     # write groups
     if len(cobra_model.groups) > 0:
         doc.enablePackage(
@@ -1446,6 +1504,8 @@ def _model_to_sbml(
         model_group = model.getPlugin(
             "groups"
         )  # noqa: E501 type: libsbml.GroupsModelPlugin
+        # member ids are looked up in the replaced ids of the model objects
+        reaction_id_map = dict(zip(cobra_model.reactions.list_attr("id"), reaction_ids))
         for cobra_group in cobra_model.groups:
             group: "libsbml.Group" = model_group.createGroup()
             if f_replace and F_GROUP_REV in f_replace:
@@ -1466,14 +1526,11 @@ def _model_to_sbml(
 
                 # id replacements
                 if "Reaction" in m_type:
-                    if f_replace and F_REACTION_REV in f_replace:
-                        mid = f_replace[F_REACTION_REV](mid)
+                    mid = reaction_id_map.get(mid, mid)
                 if "Metabolite" in m_type:
-                    if f_replace and F_SPECIE_REV in f_replace:
-                        mid = f_replace[F_SPECIE_REV](mid)
+                    mid = specie_id_map.get(mid, mid)
                 if "Gene" in m_type:
-                    if f_replace and F_GENE_REV in f_replace:
-                        mid = f_replace[F_GENE_REV](mid)
+                    mid = gene_id_map.get(mid, mid)
 
                 member.setIdRef(mid)
                 if cobra_member.name and len(cobra_member.name) > 0:
@@ -1489,6 +1546,7 @@ def _create_bound(
     f_replace: dict,
     units: Optional[bool] = None,
     flux_udef: Optional[libsbml.UnitDefinition] = None,
+    default_bound_ids: Optional[dict] = None,
 ) -> str:
     """Create bound in model for given reaction.
 
@@ -1508,23 +1566,21 @@ def _create_bound(
         Whether or not to use flux units in the SBML document.
     flux_udef: libsbml.UnitDefinition, optional
         Unit definition if units are used.
+    default_bound_ids: dict, optional
+        Precomputed mapping of default bound values to parameter ids, see
+        `_default_bound_ids` (default None).
 
     Returns
     -------
     pid: str
         Id of bound parameter.
     """
+    if default_bound_ids is None:
+        default_bound_ids = _default_bound_ids()
     value = getattr(reaction, bound_type)
-    if value == config.lower_bound:
-        return LOWER_BOUND_ID
-    elif value == 0:
-        return ZERO_BOUND_ID
-    elif value == config.upper_bound:
-        return UPPER_BOUND_ID
-    elif value == -float("Inf"):
-        return BOUND_MINUS_INF
-    elif value == float("Inf"):
-        return BOUND_PLUS_INF
+    pid = default_bound_ids.get(value)
+    if pid is not None:
+        return pid
     else:
         # new parameter
         rid = reaction.id
@@ -1542,6 +1598,26 @@ def _create_bound(
         return pid
 
 
+def _default_bound_ids() -> dict:
+    """Map the values of the default flux bounds to their parameter ids.
+
+    Returns
+    -------
+    dict
+        Parameter ids of the default bounds keyed by their value. If values
+        coincide, the lower bound takes precedence over the zero bound, the zero
+        bound over the upper bound, and the upper bound over infinite bounds.
+    """
+    # entries later in the dict take precedence for coinciding values
+    return {
+        float("Inf"): BOUND_PLUS_INF,
+        -float("Inf"): BOUND_MINUS_INF,
+        config.upper_bound: UPPER_BOUND_ID,
+        0: ZERO_BOUND_ID,
+        config.lower_bound: LOWER_BOUND_ID,
+    }
+
+
 def _create_parameter(
     model: libsbml.Model,
     pid: str,
@@ -1751,6 +1827,16 @@ QUALIFIER_TYPES = {
     "bqm_hasInstance": libsbml.BQM_HAS_INSTANCE,
     "bqm_unknown": libsbml.BQM_UNKNOWN,
 }
+# (qualifier type, qualifier) of the supported qualifiers for writing CV terms
+SBML_QUALIFIERS = {
+    key: (
+        libsbml.MODEL_QUALIFIER
+        if key.startswith("bqm_")
+        else libsbml.BIOLOGICAL_QUALIFIER,
+        qualifier,
+    )
+    for key, qualifier in QUALIFIER_TYPES.items()
+}
 
 
 def _parse_annotations(sbase: libsbml.SBase) -> dict:
@@ -1777,31 +1863,40 @@ def _parse_annotations(sbase: libsbml.SBase) -> dict:
         annotation["sbo"] = sbase.getSBOTermID()
 
     # RDF annotation
-    cvterms = sbase.getCVTerms()
-    if cvterms is None:
+    cvterms = [sbase.getCVTerm(k) for k in range(sbase.getNumCVTerms())]
+
+    # FIXME: read and store the qualifier
+    uris = [
+        cvterm.getResourceURI(k)
+        for cvterm in cvterms
+        for k in range(cvterm.getNumResources())
+    ]
+    if not uris:
         return annotation
 
-    cvterm: "libsbml.CVTerm"
-    for cvterm in cvterms:
-        for k in range(cvterm.getNumResources()):
-            # FIXME: read and store the qualifier
-
-            uri = cvterm.getResourceURI(k)
-            data = _parse_annotation_info(uri)
-            if data is None:
-                continue
-            else:
-                provider, identifier = data
-
-            if provider in annotation:
-                if isinstance(annotation[provider], str):
-                    annotation[provider] = [annotation[provider]]
-                # FIXME: use a list
-                if identifier not in annotation[provider]:
-                    annotation[provider].append(identifier)
-            else:
-                # FIXME: always in list
-                annotation[provider] = identifier
+    # collect all identifiers per provider before merging them
+    identifiers = defaultdict(list)
+    # providers with more than one resource are stored as list, even if the
+    # additional resources are duplicates
+    multiple = set()
+    for provider, value in annotation.items():
+        identifiers[provider].append(value)
+    for data in map(_parse_annotation_info, uris):
+        if data is None:
+            continue
+        provider, identifier = data
+        provider_identifiers = identifiers[provider]
+        if provider_identifiers:
+            multiple.add(provider)
+        if identifier not in provider_identifiers:
+            provider_identifiers.append(identifier)
+
+    # FIXME: always in list
+    for provider, provider_identifiers in identifiers.items():
+        if provider in multiple:
+            annotation[provider] = provider_identifiers
+        else:
+            annotation[provider] = provider_identifiers[0]
 
     return annotation
 
@@ -1888,18 +1983,18 @@ def _sbase_annotations(sbase: libsbml.SBase, annotation: dict) -> None:
             # FIXME: sbo should also be written as CVTerm
             continue
 
+        resource_prefix = f"{URL_IDENTIFIERS_PREFIX}/{provider}/"
         for item in data:
             qualifier_str, entity = item[0], item[1]
-            qualifier = QUALIFIER_TYPES.get(qualifier_str, None)
+            qualifier_type, qualifier = SBML_QUALIFIERS.get(qualifier_str, (None, None))
             if qualifier is None:
                 qualifier = libsbml.BQB_IS
                 LOGGER.error(
                     f"Qualifier type is not supported on annotation: '{qualifier_str}'"
                 )
-
-            qualifier_type = libsbml.BIOLOGICAL_QUALIFIER
-            if qualifier_str.startswith("bqm_"):
-                qualifier_type = libsbml.MODEL_QUALIFIER
+                qualifier_type = libsbml.BIOLOGICAL_QUALIFIER
+                if qualifier_str.startswith("bqm_"):
+                    qualifier_type = libsbml.MODEL_QUALIFIER
 
             cv: "libsbml.CVTerm" = libsbml.CVTerm()
             cv.setQualifierType(qualifier_type)
@@ -1909,7 +2004,7 @@ def _sbase_annotations(sbase: libsbml.SBase, annotation: dict) -> None:
                 cv.setModelQualifierType(qualifier)
             else:
                 raise CobraSBMLError(f"Unsupported qualifier: {qualifier}")
-            resource = f"{URL_IDENTIFIERS_PREFIX}/{provider}/{entity}"
+            resource = f"{resource_prefix}{entity}"
             cv.addResource(resource)
             _check(
                 sbase.addCVTerm(cv),
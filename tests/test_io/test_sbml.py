@@ -316,6 +316,18 @@ def test_from_sbml_string(data_directory: Path) -> None:
     TestCobraIO.compare_models(name="read from string", model1=model1, model2=model2)
 
 
+def test_missing_path(tmp_path: Path) -> None:
+    """Test that reading a non-existing path raises an IOError.
+
+    Parameters
+    ----------
+    tmp_path: Path
+        Directory to use for temporary data.
+    """
+    with pytest.raises(IOError):
+        read_sbml_model(tmp_path / "missing.xml")
+
+
 @pytest.mark.skip(reason="Model history currently not written")
 def test_model_history(tmp_path: Path) -> None:
     """Testing reading and writing of ModelHistory.
@@ -572,6 +584,79 @@ def test_identifiers_annotation() -> None:
         assert data is None
 
 
+def test_missing_species_reference() -> None:
+    """Test that a reference to an unknown species names the species."""
+    import libsbml
+
+    from cobra.io.sbml import CobraSBMLError, _sbml_to_model
+
+    sbml = """<?xml version="1.0" encoding="UTF-8"?>
+<sbml xmlns="http://www.sbml.org/sbml/level3/version1/core" level="3" version="1">
+  <model id="missing_species">
+    <listOfCompartments>
+      <compartment id="c" constant="true"/>
+    </listOfCompartments>
+    <listOfSpecies>
+      <species id="A" compartment="c" hasOnlySubstanceUnits="false"
+        boundaryCondition="false" constant="false"/>
+    </listOfSpecies>
+    <listOfReactions>
+      <reaction id="R1" reversible="true" fast="false">
+        <listOfReactants>
+          <speciesReference species="A" stoichiometry="1" constant="true"/>
+        </listOfReactants>
+        <listOfProducts>
+          <speciesReference species="B" stoichiometry="1" constant="true"/>
+        </listOfProducts>
+      </reaction>
+    </listOfReactions>
+  </model>
+</sbml>"""
+    doc = libsbml.readSBMLFromString(sbml)
+    with pytest.raises(CobraSBMLError, match="Species 'B' not found for reaction"):
+        _sbml_to_model(doc)
+
+
+def test_annotation_duplicate_resources() -> None:
+    """Test that providers with repeated resources are read as lists."""
+    sbml = """<?xml version="1.0" encoding="UTF-8"?>
+<sbml xmlns="http://www.sbml.org/sbml/level3/version1/core" level="3" version="1">
+  <model id="annotation_test">
+    <listOfCompartments>
+      <compartment id="c" constant="true"/>
+    </listOfCompartments>
+    <listOfSpecies>
+      <species metaid="meta_A" id="A" compartment="c" constant="false"
+        hasOnlySubstanceUnits="false" boundaryCondition="false"
+        sboTerm="SBO:0000247">
+        <annotation>
+          <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+            xmlns:bqbiol="http://biomodels.net/biology-qualifiers/">
+            <rdf:Description rdf:about="#meta_A">
+              <bqbiol:is>
+                <rdf:Bag>
+                  <rdf:li rdf:resource="http://identifiers.org/sbo/SBO:0000247"/>
+                  <rdf:li rdf:resource="http://identifiers.org/chebi/CHEBI:1"/>
+                  <rdf:li rdf:resource="http://identifiers.org/chebi/CHEBI:1"/>
+                  <rdf:li rdf:resource="http://identifiers.org/kegg.compound/C1"/>
+                </rdf:Bag>
+              </bqbiol:is>
+            </rdf:Description>
+          </rdf:RDF>
+        </annotation>
+      </species>
+    </listOfSpecies>
+  </model>
+</sbml>"""
+    model = read_sbml_model(sbml)
+    annotation = model.metabolites.get_by_id("A").annotation
+    assert annotation == {
+        "sbo": ["SBO:0000247"],
+        "chebi": ["CHEBI:1"],
+        "kegg.compound": "C1",
+    }
+
+
 def test_smbl_with_notes(data_directory: Path, tmp_path: Path) -> None:
     """Test that NOTES in the RECON 2.2 style are written and read correctly.
 
@@ -706,6 +791,56 @@ def test_stable_gprs(data_directory: Path, tmp_path: Path) -> None:
     )
 
 
+def test_nested_gpr_association() -> None:
+    """Test that nested fbc associations are read into the correct GPR."""
+    depth = 10
+    association = '<fbc:geneProductRef fbc:geneProduct="g0"/>'
+    rule = "g0"
+    for i in range(1, depth):
+        op = "and" if i % 2 else "or"
+        association = (
+            f"<fbc:{op}>"
+            f'<fbc:geneProductRef fbc:geneProduct="g{i}"/>{association}'
+            f"</fbc:{op}>"
+        )
+        rule = f"g{i} {op} {rule}" if i == 1 else f"g{i} {op} ({rule})"
+    gene_products = "".join(
+        f'<fbc:geneProduct fbc:id="g{i}" fbc:label="g{i}"/>' for i in range(depth)
+    )
+    sbml = f"""<?xml version="1.0" encoding="UTF-8"?>
+<sbml xmlns="http://www.sbml.org/sbml/level3/version1/core"
+  xmlns:fbc="http://www.sbml.org/sbml/level3/version1/fbc/version2"
+  level="3" version="1" fbc:required="false">
+  <model id="nested_gpr" fbc:strict="true">
+    <listOfCompartments>
+      <compartment id="c" constant="true"/>
+    </listOfCompartments>
+    <listOfSpecies>
+      <species id="A" compartment="c" hasOnlySubstanceUnits="false"
+        boundaryCondition="false" constant="false"/>
+    </listOfSpecies>
+    <listOfParameters>
+      <parameter id="lb" value="-1000" constant="true"/>
+      <parameter id="ub" value="1000" constant="true"/>
+    </listOfParameters>
+    <listOfReactions>
+      <reaction id="R1" reversible="true" fast="false"
+        fbc:lowerFluxBound="lb" fbc:upperFluxBound="ub">
+        <listOfReactants>
+          <speciesReference species="A" stoichiometry="1" constant="true"/>
+        </listOfReactants>
+        <fbc:geneProductAssociation>{association}</fbc:geneProductAssociation>
+      </reaction>
+    </listOfReactions>
+    <fbc:listOfGeneProducts>{gene_products}</fbc:listOfGeneProducts>
+  </model>
+</sbml>"""
+    model = read_sbml_model(sbml)
+    reaction = model.reactions.get_by_id("R1")
+    assert reaction.gene_reaction_rule == rule
+    assert len(reaction.genes) == depth
+
+
 def test_history(data_directory: Path) -> None:
     """Test that the history is read from the model."""
     mini = read_sbml_model(join(data_directory, "mini_history.xml"))